@@ -1,3 +1,6 @@
+from .memoryone import MemoryOnePlayer
+
+
 class Anand(MemoryOnePlayer):
     """
     Uses a zero-determinant strategy for extortion.
@@ -12,6 +15,8 @@ class Anand(MemoryOnePlayer):
         'manipulates_source': False,
         'manipulates_state': False
     }
+
+    _FOUR_VECTOR = (7/9, 0, 8/9, 0)
     
     def __init__(self) -> None:
         super().__init__()
@@ -20,10 +25,4 @@ class Anand(MemoryOnePlayer):
         pass
 
     def receive_match_attributes(self):
-        p1 = 7/9
-        p2 = 0
-        p3 = 8/9
-        p4 = 0
-
-        four_vector = [p1, p2, p3, p4]
-        self.set_four_vector(four_vector)
+        self.set_four_vector(self._FOUR_VECTOR)
@@ -6,6 +6,7 @@ For the original see:
 """
 from typing import Any
 
+import numpy as np
 from axelrod.action import Action, actions_to_str, str_to_actions
 from axelrod.load_data_ import load_pso_tables
 from axelrod.player import Player
@@ -42,12 +43,180 @@ class Gambler(LookerUp):
         "manipulates_state": False,
     }
 
+    # Subclasses built from a fixed pattern can set this to share a single
+    # LookupTable between all of their instances.
+    _share_lookup_table = False
+
+    @classmethod
+    def _get_lookup_table(
+        cls, lookup_dict: dict, pattern: Any, parameters: tuple
+    ) -> LookupTable:
+        if not cls._share_lookup_table:
+            return super()._get_lookup_table(lookup_dict, pattern, parameters)
+        # Look in the class's own namespace so that subclasses do not pick
+        # up a table cached by their parent.
+        lookup_table = cls.__dict__.get("_cached_lookup_table")
+        if lookup_table is None:
+            lookup_table = super()._get_lookup_table(
+                lookup_dict, pattern, parameters
+            )
+            cls._cached_lookup_table = lookup_table
+        return lookup_table
+
+    def __init__(
+        self,
+        lookup_dict: dict = None,
+        initial_actions: tuple = None,
+        pattern: Any = None,  # pattern is str or tuple of Actions.
+        parameters: Plays = None,
+    ) -> None:
+        LookerUp.__init__(
+            self,
+            lookup_dict=lookup_dict,
+            initial_actions=initial_actions,
+            pattern=pattern,
+            parameters=parameters,
+        )
+        self._probs, self._fast_table = self._get_tables(
+            lookup_dict, pattern, parameters, self._lookup
+        )
+        # Cached to avoid the table's property lookups on every turn.
+        self._plays_depth = self._lookup.player_depth
+        self._op_plays_depth = self._lookup.op_depth
+        self._op_openings_depth = self._lookup.op_openings_depth
+
+    @classmethod
+    def _get_tables(
+        cls,
+        lookup_dict: dict,
+        pattern: Any,
+        parameters: tuple,
+        lookup_table: LookupTable,
+    ) -> tuple:
+        """Returns the probabilities of cooperating and the fast table. These
+        are shared between instances alongside the lookup table when
+        _share_lookup_table is set."""
+        if cls._share_lookup_table and "_cached_probs" in cls.__dict__:
+            return cls._cached_probs, cls._cached_fast_table
+        if not lookup_dict and pattern is not None and parameters is not None:
+            # The pattern is already in the order of the table's keys.
+            probabilities = cls._get_pattern_probabilities(pattern)
+        else:
+            probabilities = cls._get_probabilities(lookup_table)
+        fast_table = cls._get_fast_table(probabilities)
+        if cls._share_lookup_table:
+            cls._cached_probs = probabilities
+            cls._cached_fast_table = fast_table
+        return probabilities, fast_table
+
+    @staticmethod
+    def _get_fast_table(probabilities: np.ndarray) -> list:
+        """Returns the probabilities as a list with every probability of 0 or 1
+        replaced by the corresponding Action, so that no random draw is needed
+        for those plays."""
+        fast_table = []
+        for reaction in probabilities.tolist():
+            if reaction == 1:
+                reaction = C
+            elif reaction == 0:
+                reaction = D
+            fast_table.append(reaction)
+        return fast_table
+
+    @classmethod
+    def _get_probabilities(cls, lookup_table: LookupTable) -> np.ndarray:
+        """Returns the probabilities of cooperating as a flat array, ordered as
+        the keys of create_lookup_table_keys."""
+        keys = create_lookup_table_keys(
+            player_depth=lookup_table.player_depth,
+            op_depth=lookup_table.op_depth,
+            op_openings_depth=lookup_table.op_openings_depth,
+        )
+        dictionary = lookup_table.dictionary
+        return cls._get_pattern_probabilities(
+            [dictionary[plays] for plays in keys]
+        )
+
+    @staticmethod
+    def _get_pattern_probabilities(pattern: Any) -> np.ndarray:
+        """Returns the probabilities of cooperating given by a pattern as a
+        flat array."""
+        if isinstance(pattern, str):
+            pattern = str_to_actions(pattern)
+        probabilities = np.empty(len(pattern), dtype=np.float64)
+        for index, reaction in enumerate(pattern):
+            if isinstance(reaction, Action):
+                reaction = float(reaction == C)
+            probabilities[index] = reaction
+        return probabilities
+
     def strategy(self, opponent: Player) -> Action:
         """Actual strategy definition that determines player's action."""
-        actions_or_float = super(Gambler, self).strategy(opponent)
-        if isinstance(actions_or_float, Action):
-            return actions_or_float
-        return self._random.random_choice(actions_or_float)
+        turn_index = len(opponent.history)
+        if turn_index < len(self._initial_actions_pool):
+            return self._initial_actions_pool[turn_index]
+
+        # Pack the plays into the index of their key in the table, as ordered
+        # by create_lookup_table_keys: one bit per play, D being 1.
+        index = 0
+        history = self.history
+        for action in history[len(history) - self._plays_depth :]:
+            index = (index << 1) | (action is D)
+        history = opponent.history
+        for action in history[len(history) - self._op_plays_depth :]:
+            index = (index << 1) | (action is D)
+        for action in history[: self._op_openings_depth]:
+            index = (index << 1) | (action is D)
+
+        reaction = self._fast_table[index]
+        if type(reaction) is Action:
+            return reaction
+        # Inlined random_choice: the probability is known to be in (0, 1).
+        if self._random.random() < reaction:
+            return C
+        return D
+
+    def vectorized_step(
+        self,
+        self_plays: np.ndarray,
+        op_plays: np.ndarray,
+        op_openings: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Plays a single turn for a batch of histories at once.
+
+        This is public API for callers simulating many histories outside of a
+        Match: nothing in the library calls it. It only reads the lookup table,
+        so initial actions are ignored and the caller is responsible for the
+        first turns.
+
+        Each argument is an integer array of shape (batch size, depth) holding,
+        for each history, the plays used by the lookup table in chronological
+        order, encoded as their Action values (0 for C and 1 for D). The depths
+        must be those of the table's parameters. The plays are packed into the
+        index of the table's key and all moves are drawn in a single call to
+        the random number generator.
+
+        Returns a boolean array that is True where the player cooperates.
+        """
+        depths = (
+            self._plays_depth,
+            self._op_plays_depth,
+            self._op_openings_depth,
+        )
+        widths = tuple(
+            np.shape(plays)[1] for plays in (self_plays, op_plays, op_openings)
+        )
+        if widths != depths:
+            msg = "Plays must have widths: {}, but had widths: {}".format(
+                depths, widths
+            )
+            raise ValueError(msg)
+        plays = np.hstack((self_plays, op_plays, op_openings)).astype(np.int64)
+        index = np.zeros(len(plays), dtype=np.int64)
+        for column in plays.T:
+            index = np.bitwise_or(np.left_shift(index, 1), column)
+        return self._random.random(len(index)) < self._probs[index]
 
 
 class EvolvableGambler(Gambler, EvolvableLookerUp):
@@ -62,22 +231,25 @@ class EvolvableGambler(Gambler, EvolvableLookerUp):
         mutation_probability: float = None,
         seed: int = None,
     ) -> None:
-        EvolvableLookerUp.__init__(
+        (
+            lookup_dict,
+            initial_actions,
+            pattern,
+            parameters,
+        ) = self._prepare_parameters(
+            lookup_dict,
+            initial_actions,
+            pattern,
+            parameters,
+            mutation_probability,
+            seed,
+        )
+        Gambler.__init__(
             self,
             lookup_dict=lookup_dict,
             initial_actions=initial_actions,
-            pattern=pattern,
+            pattern=list(pattern),
             parameters=parameters,
-            mutation_probability=mutation_probability,
-            seed=seed,
-        )
-        self.pattern = list(self.pattern)
-        Gambler.__init__(
-            self,
-            lookup_dict=self.lookup_dict,
-            initial_actions=self.initial_actions,
-            pattern=self.pattern,
-            parameters=self.parameters,
         )
         self.overwrite_init_kwargs(
             lookup_dict=self.lookup_dict,
@@ -90,25 +262,85 @@ class EvolvableGambler(Gambler, EvolvableLookerUp):
     # The mutate and crossover methods are mostly inherited from EvolvableLookerUp, except for the following
     # modifications.
 
-    def random_value(self) -> float:
-        return self._random.random()
+    def random_value(self, *size):
+        """Draws probabilities in [0, 1): a single float, or an array of the
+        given size."""
+        return self._random.random(*size)
+
+    def random_params(self, plays, op_plays, op_start_plays):
+        keys = create_lookup_table_keys(plays, op_plays, op_start_plays)
+        # Draw the whole pattern in a single call to the generator.
+        pattern = self.random_value(len(keys)).tolist()
+        table = dict(zip(keys, pattern))
+        return pattern, LookupTable(table)
+
+    def _perturbation(self, *size):
+        """Draws uniform perturbations in [-1/4, 1/4) for mutation."""
+        return self._random.random(*size) * 0.5 - 0.25
 
     def mutate_value(self, value: float) -> float:
-        ep = self._random.uniform(-1, 1) / 4
-        value += ep
-        if value < 0:
-            value = 0
-        elif value > 1:
-            value = 1
-        return value
+        """Perturbs a single probability as mutate_table does, clipping it to
+        [0, 1]. Nothing in the library calls this any more: it is kept only
+        for API compatibility."""
+        return max(0.0, min(1.0, value + self._perturbation()))
+
+    def mutate_table(self, table, mutation_probability):
+        """Perturbs each probability with a probability proportional to the
+        mutation rate, clipping the results to [0, 1]."""
+        keys = list(table.keys())
+        values = np.array([table[key] for key in keys], dtype=np.float64)
+        size = len(keys)
+        randoms = self._random.random(size)
+        values += np.where(
+            randoms < mutation_probability, self._perturbation(size), 0.0
+        )
+        np.clip(values, 0.0, 1.0, out=values)
+        return dict(zip(keys, values.tolist()))
+
+    def crossover(self, other):
+        if other.__class__ != self.__class__:
+            raise TypeError(
+                "Crossover must be between the same player classes."
+            )
+        if tuple(self.parameters) != tuple(other.parameters):
+            raise ValueError(
+                "Crossover must be between players with the same parameters."
+            )
+        # The probability arrays share the key order of
+        # create_lookup_table_keys, so they can be spliced directly.
+        cross_point = self._random.randint(0, len(self._probs))
+        pattern = np.concatenate(
+            (self._probs[:cross_point], other._probs[cross_point:])
+        )
+        keys = create_lookup_table_keys(*self.parameters)
+        lookup_dict = dict(zip(keys, pattern.tolist()))
+        return self.create_new(lookup_dict=lookup_dict)
+
+    @property
+    def _lookup(self) -> LookupTable:
+        # The table is only rebuilt from the pattern when it is needed, as
+        # receive_vector updates the probabilities in place.
+        lookup_table = self.__dict__.get("_lookup")
+        if lookup_table is None:
+            self_depth, op_depth, op_openings_depth = self.parameters
+            lookup_table = LookupTable.from_pattern(
+                self.pattern, self_depth, op_depth, op_openings_depth
+            )
+            self.__dict__["_lookup"] = lookup_table
+        return lookup_table
+
+    @_lookup.setter
+    def _lookup(self, lookup_table: LookupTable) -> None:
+        self.__dict__["_lookup"] = lookup_table
 
     def receive_vector(self, vector):
         """Receives a vector and updates the player's pattern. Ignores extra parameters."""
-        self.pattern = vector
-        self_depth, op_depth, op_openings_depth = self.parameters
-        self._lookup = LookupTable.from_pattern(
-            self.pattern, self_depth, op_depth, op_openings_depth
-        )
+        self._probs[:] = vector
+        # Keep an owned copy so the lazily rebuilt table matches play even if
+        # the caller later modifies the vector in place.
+        self.pattern = self._probs.tolist()
+        self._fast_table = self._get_fast_table(self._probs)
+        self._lookup = None
 
     def create_vector_bounds(self):
         """Creates the bounds for the decision variables. Ignores extra parameters."""
@@ -130,6 +362,7 @@ class PSOGamblerMem1(Gambler):
     """
 
     name = "PSO Gambler Mem1"
+    _share_lookup_table = True
 
     def __init__(self) -> None:
         pattern = tables[("PSO Gambler Mem1", 1, 1, 0)]
@@ -148,6 +381,7 @@ class PSOGambler1_1_1(Gambler):
     """
 
     name = "PSO Gambler 1_1_1"
+    _share_lookup_table = True
 
     def __init__(self) -> None:
         pattern = tables[("PSO Gambler 1_1_1", 1, 1, 1)]
@@ -167,6 +401,7 @@ class PSOGambler2_2_2(Gambler):
     """
 
     name = "PSO Gambler 2_2_2"
+    _share_lookup_table = True
 
     def __init__(self) -> None:
         pattern = tables[("PSO Gambler 2_2_2", 2, 2, 2)]
@@ -185,6 +420,7 @@ class PSOGambler2_2_2_Noise05(Gambler):
     """
 
     name = "PSO Gambler 2_2_2 Noise 05"
+    _share_lookup_table = True
 
     def __init__(self) -> None:
         pattern = tables[("PSO Gambler 2_2_2 Noise 05", 2, 2, 2)]
@@ -205,6 +441,7 @@ class ZDMem2(Gambler):
     """
 
     name = "ZD-Mem2"
+    _share_lookup_table = True
 
     classifier = {
         "memory_depth": 2,
@@ -1,7 +1,9 @@
 from collections import namedtuple
+from functools import lru_cache
 from itertools import product
 from typing import Any, TypeVar
 
+import numpy as np
 from axelrod.action import Action, actions_to_str, str_to_actions
 from axelrod.evolvable_player import (
     EvolvablePlayer,
@@ -12,6 +14,8 @@ from axelrod.player import Player
 
 C, D = Action.C, Action.D
 actions = (C, D)
+# Maps random integers in {0, 1} to actions with fancy indexing.
+_action_pair = np.array(actions, dtype=object)
 
 Plays = namedtuple("Plays", "self_plays, op_plays, op_openings")
 Reaction = TypeVar("Reaction", Action, float)
@@ -169,7 +173,7 @@ class LookupTable(object):
         display_line = header_line.replace("|", ",") + ": {str_list[3]},"
 
         def make_commaed_str(action_tuple):
-            return ", ".join(str(action) for action in action_tuple)
+            return ", ".join(map(str, action_tuple))
 
         line_elements = [
             (
@@ -219,12 +223,20 @@ def create_lookup_table_keys(
          Plays(self_plays=(D, D), op_plays=(D,), op_openings=())]
 
     """
+    return list(_lookup_table_keys(player_depth, op_depth, op_openings_depth))
+
+
+@lru_cache(maxsize=None)
+def _lookup_table_keys(
+    player_depth: int, op_depth: int, op_openings_depth: int
+) -> tuple:
+    """Builds the keys for create_lookup_table_keys once per set of depths."""
     self_plays = product((C, D), repeat=player_depth)
     op_plays = product((C, D), repeat=op_depth)
     op_openings = product((C, D), repeat=op_openings_depth)
 
     iterator = product(self_plays, op_plays, op_openings)
-    return [Plays(*plays_tuple) for plays_tuple in iterator]
+    return tuple(Plays(*plays_tuple) for plays_tuple in iterator)
 
 
 default_tft_lookup_table = {
@@ -412,19 +424,18 @@ class EvolvableLookerUp(LookerUp, EvolvablePlayer):
         mutation_probability: float = None,
         seed: int = None,
     ) -> None:
-        EvolvablePlayer.__init__(self, seed=seed)
         (
             lookup_dict,
             initial_actions,
             pattern,
             parameters,
-            mutation_probability,
-        ) = self._normalize_parameters(
+        ) = self._prepare_parameters(
             lookup_dict,
             initial_actions,
             pattern,
             parameters,
             mutation_probability,
+            seed,
         )
         LookerUp.__init__(
             self,
@@ -433,15 +444,43 @@ class EvolvableLookerUp(LookerUp, EvolvablePlayer):
             pattern=pattern,
             parameters=parameters,
         )
-        self.mutation_probability = mutation_probability
         self.overwrite_init_kwargs(
             lookup_dict=lookup_dict,
             initial_actions=initial_actions,
             pattern=pattern,
             parameters=parameters,
-            mutation_probability=mutation_probability,
+            mutation_probability=self.mutation_probability,
         )
 
+    def _prepare_parameters(
+        self,
+        lookup_dict,
+        initial_actions,
+        pattern,
+        parameters,
+        mutation_probability,
+        seed,
+    ):
+        """Seeds the player, sets its mutation probability and returns the
+        normalized lookup_dict, initial_actions, pattern and parameters for
+        building the lookup table."""
+        EvolvablePlayer.__init__(self, seed=seed)
+        (
+            lookup_dict,
+            initial_actions,
+            pattern,
+            parameters,
+            mutation_probability,
+        ) = self._normalize_parameters(
+            lookup_dict,
+            initial_actions,
+            pattern,
+            parameters,
+            mutation_probability,
+        )
+        self.mutation_probability = mutation_probability
+        return lookup_dict, initial_actions, pattern, parameters
+
     def _normalize_parameters(
         self,
         lookup_dict=None,
@@ -468,10 +507,6 @@ class EvolvableLookerUp(LookerUp, EvolvablePlayer):
             lookup_table = self._get_lookup_table(
                 lookup_dict, pattern, parameters
             )
-            plays, op_plays, op_start_plays = parameters
-            lookup_table = self._get_lookup_table(
-                lookup_dict, pattern, parameters
-            )
             lookup_dict = lookup_table.dictionary
         elif parameters:
             # Generate a random pattern and (maybe) initial actions
@@ -481,9 +516,9 @@ class EvolvableLookerUp(LookerUp, EvolvablePlayer):
             )
             lookup_dict = lookup_table.dictionary
             if not initial_actions:
-                num_actions = max([plays, op_plays, op_start_plays])
+                num_actions = max(plays, op_plays, op_start_plays)
                 initial_actions = tuple(
-                    [self._random.choice((C, D)) for _ in range(num_actions)]
+                    _action_pair[self._random.randint(0, 2, size=num_actions)]
                 )
         else:
             raise InsufficientParametersError(
@@ -532,14 +567,14 @@ class EvolvableLookerUp(LookerUp, EvolvablePlayer):
             self.lookup_dict, self.mutation_probability
         )
         # Add in starting moves
-        initial_actions = list(self.initial_actions)
-        for i in range(len(initial_actions)):
-            r = self._random.random()
-            if r < self.mutation_probability:
-                initial_actions[i] = initial_actions[i].flip()
+        randoms = self._random.random(len(self.initial_actions))
+        initial_actions = tuple(
+            action.flip() if r < self.mutation_probability else action
+            for action, r in zip(self.initial_actions, randoms)
+        )
         return self.create_new(
             lookup_dict=lookup_dict,
-            initial_actions=tuple(initial_actions),
+            initial_actions=initial_actions,
         )
 
     def crossover(self, other):
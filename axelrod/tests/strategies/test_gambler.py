@@ -4,6 +4,7 @@ import copy
 import unittest
 
 import axelrod as axl
+import numpy as np
 from axelrod.load_data_ import load_pso_tables
 from axelrod.strategies.lookerup import create_lookup_table_keys
 
@@ -41,6 +42,90 @@ class TestGambler(TestPlayer):
             init_kwargs={"lookup_dict": tft_table},
         )
 
+    def test_lookup_table_is_not_shared(self):
+        player1, player2 = self.player(), self.player()
+        self.assertIsNot(player1._lookup, player2._lookup)
+
+    def test_fast_table(self):
+        lookup_dict = {
+            ((C,), (C,), ()): 1,
+            ((C,), (D,), ()): 0.3,
+            ((D,), (C,), ()): D,
+            ((D,), (D,), ()): 0.0,
+        }
+        player = self.player(lookup_dict=lookup_dict)
+        self.assertEqual(player._fast_table, [C, 0.3, D, D])
+
+    def test_strategy_matches_lookerup(self):
+        pattern = "CDDCDCDCDDDDCCCCCDCDCDCDDDCDCCCD"
+        parameters = (2, 1, 2)
+        for _ in range(5):
+            opponent_actions = [random.random_choice() for _ in range(30)]
+            interactions = [
+                axl.Match(
+                    (
+                        player_class(pattern=pattern, parameters=parameters),
+                        axl.MockPlayer(actions=opponent_actions),
+                    ),
+                    turns=30,
+                    seed=0,
+                ).play()
+                for player_class in (axl.Gambler, axl.LookerUp)
+            ]
+            self.assertEqual(interactions[0], interactions[1])
+
+    def test_op_openings_read_from_current_opponent(self):
+        player = self.player(pattern="CDDD", parameters=(0, 0, 2))
+        opponent = axl.MockPlayer(actions=[C, C, C])
+        match = axl.Match((player, opponent), turns=3, seed=0)
+        self.assertEqual(match.play(), [(C, C), (C, C), (C, C)])
+
+        other_opponent = axl.MockPlayer(actions=[D, C, C])
+        axl.Match((axl.Cooperator(), other_opponent), turns=3).play()
+        self.assertEqual(player.strategy(other_opponent), D)
+
+    def test_probabilities(self):
+        pattern = [1, 0.3, 0.0, 0.6]
+        player = self.player(pattern=pattern, parameters=(1, 1, 0))
+        self.assertEqual(player._probs.tolist(), pattern)
+
+        player = self.player(pattern="CDDC", parameters=(0, 0, 2))
+        self.assertEqual(player._probs.tolist(), [1.0, 0.0, 0.0, 1.0])
+
+        player = self.player()
+        self.assertEqual(player._probs.tolist(), [1.0, 0.0])
+
+    def test_vectorized_step(self):
+        # Cooperate only if both players cooperated in the first round.
+        pattern = [1, 0, 0, 0]
+        player = self.player(pattern=pattern, parameters=(0, 0, 2))
+        player.set_seed(0)
+        empty = np.zeros((4, 0), dtype=int)
+        op_openings = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+        cooperations = player.vectorized_step(empty, empty, op_openings)
+        self.assertEqual(cooperations.tolist(), [True, False, False, False])
+
+        # Tit For Tat
+        player = self.player()
+        player.set_seed(0)
+        op_plays = np.array([[0], [1], [1], [0]])
+        cooperations = player.vectorized_step(empty, op_plays, empty)
+        self.assertEqual(cooperations.tolist(), [True, False, False, True])
+
+    def test_vectorized_step_checks_widths(self):
+        player = self.player(pattern=[1, 0, 0, 0], parameters=(1, 1, 0))
+        player.set_seed(0)
+        empty = np.zeros((4, 0), dtype=int)
+        plays = np.array([[0], [1], [1], [0]])
+        self.assertEqual(
+            player.vectorized_step(plays, plays, empty).tolist(),
+            [True, False, False, True],
+        )
+        with self.assertRaises(ValueError):
+            player.vectorized_step(plays, empty, plays)
+        with self.assertRaises(ValueError):
+            player.vectorized_step(np.hstack((plays, plays)), empty, empty)
+
     def test_stochastic_values(self):
         stochastic_lookup = {((), (), ()): 0.3}
         expected_actions = [(C, C), (D, C), (D, C), (C, C), (D, C)]
@@ -91,6 +176,21 @@ class TestPSOGamblerMem1(TestPlayer):
             seed=1,
         )
 
+    def test_lookup_table_is_shared(self):
+        player1, player2 = self.player(), self.player()
+        self.assertIs(player1._lookup, player2._lookup)
+        self.assertIs(player1._probs, player2._probs)
+        self.assertIs(player1._fast_table, player2._fast_table)
+        other_player = axl.PSOGambler1_1_1()
+        self.assertIsNot(player1._lookup, other_player._lookup)
+        self.assertIsNot(player1._probs, other_player._probs)
+
+    def test_pattern_holds_floats(self):
+        player = self.player()
+        self.assertIsInstance(player.pattern, list)
+        for value in player.lookup_dict.values():
+            self.assertIs(type(value), float)
+
 
 class TestPSOGambler1_1_1(TestPlayer):
 
@@ -552,6 +652,63 @@ class TestEvolvableGambler(unittest.TestCase):
         action_dict = dict(zip(keys, vector))
         self.assertEqual(player._lookup.dictionary, action_dict)
 
+    def test_random_value(self):
+        player = axl.EvolvableGambler(parameters=(1, 1, 1), seed=1)
+        player.set_seed(1)
+        value = player.random_value()
+        self.assertIsInstance(value, float)
+        self.assertEqual(player.random_value(3).shape, (3,))
+
+        player.set_seed(1)
+        pattern, _ = player.random_params(1, 1, 1)
+        self.assertEqual(pattern[0], value)
+
+    def test_receive_vector_updates_play(self):
+        player = axl.EvolvableGambler(
+            parameters=(1, 1, 1), initial_actions=(C,), seed=1
+        )
+        player.receive_vector([0] * 8)
+        self.assertEqual(player._probs.tolist(), [0] * 8)
+        self.assertEqual(player._fast_table, [D] * 8)
+        self.assertEqual(set(player.lookup_dict.values()), {0})
+
+        with self.assertRaises(ValueError):
+            player.receive_vector([0] * 7)
+
+    def test_receive_vector_copies_vector(self):
+        player = axl.EvolvableGambler(parameters=(1, 1, 1), seed=1)
+        vector = np.full(8, 0.25)
+        player.receive_vector(vector)
+        vector[:] = 0.9
+        self.assertEqual(player._probs.tolist(), [0.25] * 8)
+        self.assertEqual(player.pattern, [0.25] * 8)
+        self.assertEqual(set(player.lookup_dict.values()), {0.25})
+
+    def test_crossover(self):
+        player1, player2 = [
+            axl.EvolvableGambler(
+                parameters=(1, 1, 1),
+                pattern=[value] * 8,
+                initial_actions=(C,),
+                seed=seed,
+            )
+            for seed, value in enumerate((1.0, 0.0))
+        ]
+        for _ in range(10):
+            child = player1.crossover(player2)
+            pattern = child._probs.tolist()
+            cross_point = pattern.count(1.0)
+            expected = [1.0] * cross_point + [0.0] * (8 - cross_point)
+            self.assertEqual(pattern, expected)
+
+    def test_crossover_mismatched_parameters(self):
+        player1 = axl.EvolvableGambler(parameters=(1, 1, 1), seed=1)
+        player2 = axl.EvolvableGambler(parameters=(2, 2, 2), seed=2)
+        with self.assertRaises(ValueError):
+            player1.crossover(player2)
+        with self.assertRaises(ValueError):
+            player2.crossover(player1)
+
     def test_create_vector_bounds(self):
         plays, op_plays, op_start_plays = 1, 1, 1
         player = axl.EvolvableGambler(
@@ -568,6 +725,28 @@ class TestEvolvableGambler(unittest.TestCase):
         self.assertEqual(player.mutate_value(2), 1)
         self.assertEqual(player.mutate_value(-2), 0)
 
+    def test_mutate_value_matches_mutate_table(self):
+        player = axl.EvolvableGambler(parameters=(1, 1, 1), seed=0)
+        for value in (0.0, 0.1, 0.5, 0.9, 1.0):
+            player.set_seed(5)
+            mutated_table = player.mutate_table({"key": value}, 1)
+            player.set_seed(5)
+            player._random.random()  # The draw deciding whether to mutate.
+            self.assertAlmostEqual(
+                player.mutate_value(value), mutated_table["key"]
+            )
+
+    def test_mutate_table(self):
+        player = axl.EvolvableGambler(parameters=(1, 1, 1), seed=0)
+        table = player.lookup_dict
+        self.assertEqual(player.mutate_table(table.copy(), 0), table)
+        mutated = player.mutate_table(table.copy(), 1)
+        self.assertEqual(list(mutated.keys()), list(table.keys()))
+        self.assertNotEqual(mutated, table)
+        for value in mutated.values():
+            self.assertGreaterEqual(value, 0)
+            self.assertLessEqual(value, 1)
+
 
 class TestEvolvableGambler2(TestEvolvablePlayer):
     name = "EvolvableGambler"
@@ -187,6 +187,20 @@ class TestLookupTableHelperFunctions(unittest.TestCase):
         self.assertEqual(actual, expected)
         self.assertIsInstance(actual[0], Plays)
 
+    def test_create_lookup_table_keys_returns_new_list(self):
+        keys = create_lookup_table_keys(
+            player_depth=1, op_depth=1, op_openings_depth=0
+        )
+        keys.clear()
+        self.assertEqual(
+            len(
+                create_lookup_table_keys(
+                    player_depth=1, op_depth=1, op_openings_depth=0
+                )
+            ),
+            4,
+        )
+
 
 class TestLookerUp(TestPlayer):
     name = "LookerUp"